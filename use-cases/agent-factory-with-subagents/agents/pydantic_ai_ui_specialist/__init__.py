@@ -4,14 +4,27 @@ Pydantic AI UI Specialist Agent
 A specialized AI agent for UI/UX analysis and recommendations.
 """
 
-from .agent import agent, analyze_component
+from .agent import (
+    get_agent,
+    analyze_component,
+    analyze_component_stream,
+    analyze_component_structured,
+    analyze_components_batch,
+)
 from .settings import Settings, load_settings, get_llm_model
 from .dependencies import UIAnalysisContext, UIRecommendation, AnalysisResult
-from .prompts import get_system_prompt, get_analysis_prompt
+from .prompts import (
+    get_system_prompt,
+    get_analysis_prompt,
+    get_structured_analysis_prompt,
+)
 
 __all__ = [
-    "agent",
+    "get_agent",
     "analyze_component",
+    "analyze_component_stream",
+    "analyze_component_structured",
+    "analyze_components_batch",
     "Settings",
     "load_settings",
     "get_llm_model",
@@ -20,6 +33,7 @@ __all__ = [
     "AnalysisResult",
     "get_system_prompt",
     "get_analysis_prompt",
+    "get_structured_analysis_prompt",
 ]
 
 __version__ = "1.0.0"
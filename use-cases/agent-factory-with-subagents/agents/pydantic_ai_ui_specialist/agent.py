@@ -4,28 +4,37 @@ UI Specialist Pydantic AI Agent
 Main agent implementation for UI/UX analysis and recommendations.
 """
 
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Dict, List, Optional
+
 from pydantic_ai import Agent, RunContext
-from .settings import get_llm_model
-from .prompts import get_system_prompt, get_analysis_prompt
-from .dependencies import UIAnalysisContext
+from pydantic_ai.messages import (
+    PartDeltaEvent,
+    PartStartEvent,
+    TextPart,
+    TextPartDelta,
+)
+from .settings import get_llm_model, load_settings
+from .cache import get_response_cache
+from .prompts import (
+    get_system_prompt,
+    get_analysis_prompt,
+    get_structured_analysis_prompt,
+)
+from .dependencies import AnalysisResult, UIAnalysisContext
 from .tools import (
     check_color_contrast,
-    analyze_accessibility_issues,
-    analyze_responsive_design,
-    analyze_performance,
-    analyze_ux_patterns,
+    check_color_contrast_batch,
+    component_digest,
     get_wcag_guidelines,
 )
 
-# Initialize the UI Specialist agent
-agent = Agent(
-    get_llm_model(),
-    deps_type=UIAnalysisContext,
-    system_prompt=get_system_prompt(),
-)
+# Components longer than this are scanned in a worker thread so the regex
+# work doesn't stall other runs sharing the event loop
+OFFLOAD_SCAN_CHARS = 16_384
 
 
-@agent.tool
 def analyze_accessibility(ctx: RunContext[UIAnalysisContext]) -> str:
     """
     Analyze component code for accessibility issues.
@@ -36,21 +45,20 @@ def analyze_accessibility(ctx: RunContext[UIAnalysisContext]) -> str:
     Returns:
         JSON string of accessibility issues found
     """
-    issues = analyze_accessibility_issues(ctx.deps.component_code)
+    issues = ctx.deps.scan["accessibility"]
 
     if not issues:
         return "No accessibility issues found. Component follows WCAG guidelines."
 
-    result = "Accessibility Issues Found:\n\n"
+    parts = ["Accessibility Issues Found:\n\n"]
     for i, issue in enumerate(issues, 1):
-        result += f"{i}. [{issue['severity'].upper()}] {issue['issue']}\n"
-        result += f"   {issue['description']}\n"
-        result += f"   Fix: {issue['fix']}\n\n"
+        parts.append(f"{i}. [{issue.severity.upper()}] {issue.issue}\n")
+        parts.append(f"   {issue.description}\n")
+        parts.append(f"   Fix: {issue.fix}\n\n")
 
-    return result
+    return "".join(parts)
 
 
-@agent.tool
 def analyze_responsive_patterns(ctx: RunContext[UIAnalysisContext]) -> str:
     """
     Analyze component for responsive design patterns.
@@ -61,21 +69,20 @@ def analyze_responsive_patterns(ctx: RunContext[UIAnalysisContext]) -> str:
     Returns:
         JSON string of responsive design recommendations
     """
-    recommendations = analyze_responsive_design(ctx.deps.component_code)
+    recommendations = ctx.deps.scan["responsive"]
 
     if not recommendations:
         return "Component follows responsive design best practices."
 
-    result = "Responsive Design Recommendations:\n\n"
+    parts = ["Responsive Design Recommendations:\n\n"]
     for i, rec in enumerate(recommendations, 1):
-        result += f"{i}. [{rec['severity'].upper()}] {rec['issue']}\n"
-        result += f"   {rec['description']}\n"
-        result += f"   Recommendation: {rec['fix']}\n\n"
+        parts.append(f"{i}. [{rec.severity.upper()}] {rec.issue}\n")
+        parts.append(f"   {rec.description}\n")
+        parts.append(f"   Recommendation: {rec.fix}\n\n")
 
-    return result
+    return "".join(parts)
 
 
-@agent.tool
 def analyze_performance_optimizations(ctx: RunContext[UIAnalysisContext]) -> str:
     """
     Analyze component for performance optimization opportunities.
@@ -86,21 +93,20 @@ def analyze_performance_optimizations(ctx: RunContext[UIAnalysisContext]) -> str
     Returns:
         JSON string of performance recommendations
     """
-    recommendations = analyze_performance(ctx.deps.component_code)
+    recommendations = ctx.deps.scan["performance"]
 
     if not recommendations:
         return "Component is well-optimized for performance."
 
-    result = "Performance Optimization Opportunities:\n\n"
+    parts = ["Performance Optimization Opportunities:\n\n"]
     for i, rec in enumerate(recommendations, 1):
-        result += f"{i}. [{rec['severity'].upper()}] {rec['issue']}\n"
-        result += f"   {rec['description']}\n"
-        result += f"   Optimization: {rec['fix']}\n\n"
+        parts.append(f"{i}. [{rec.severity.upper()}] {rec.issue}\n")
+        parts.append(f"   {rec.description}\n")
+        parts.append(f"   Optimization: {rec.fix}\n\n")
 
-    return result
+    return "".join(parts)
 
 
-@agent.tool
 def analyze_ux_best_practices(ctx: RunContext[UIAnalysisContext]) -> str:
     """
     Analyze component for UX best practices.
@@ -111,21 +117,20 @@ def analyze_ux_best_practices(ctx: RunContext[UIAnalysisContext]) -> str:
     Returns:
         JSON string of UX recommendations
     """
-    recommendations = analyze_ux_patterns(ctx.deps.component_code)
+    recommendations = ctx.deps.scan["ux"]
 
     if not recommendations:
         return "Component follows UX best practices."
 
-    result = "UX Pattern Recommendations:\n\n"
+    parts = ["UX Pattern Recommendations:\n\n"]
     for i, rec in enumerate(recommendations, 1):
-        result += f"{i}. [{rec['severity'].upper()}] {rec['issue']}\n"
-        result += f"   {rec['description']}\n"
-        result += f"   Best Practice: {rec['fix']}\n\n"
+        parts.append(f"{i}. [{rec.severity.upper()}] {rec.issue}\n")
+        parts.append(f"   {rec.description}\n")
+        parts.append(f"   Best Practice: {rec.fix}\n\n")
 
-    return result
+    return "".join(parts)
 
 
-@agent.tool_plain
 def get_wcag_reference() -> str:
     """
     Get WCAG 2.1 accessibility guidelines reference.
@@ -135,16 +140,15 @@ def get_wcag_reference() -> str:
     """
     guidelines = get_wcag_guidelines()
 
-    result = "WCAG 2.1 Key Guidelines:\n\n"
+    parts = ["WCAG 2.1 Key Guidelines:\n\n"]
     for guideline in guidelines:
-        result += f"• {guideline['principle']} - {guideline['guideline']}\n"
-        result += f"  Requirement: {guideline['requirement']}\n"
-        result += f"  Level: {guideline['level']}\n\n"
+        parts.append(f"• {guideline['principle']} - {guideline['guideline']}\n")
+        parts.append(f"  Requirement: {guideline['requirement']}\n")
+        parts.append(f"  Level: {guideline['level']}\n\n")
 
-    return result
+    return "".join(parts)
 
 
-@agent.tool_plain
 def check_contrast_ratio(foreground: str, background: str, text_size: str = "normal") -> str:
     """
     Check color contrast ratio for WCAG compliance.
@@ -157,18 +161,213 @@ def check_contrast_ratio(foreground: str, background: str, text_size: str = "nor
     Returns:
         Contrast ratio analysis
     """
-    result = check_color_contrast(foreground, background, text_size)
+    try:
+        result = check_color_contrast(foreground, background, text_size)
+    except ValueError as e:
+        return f"Color Contrast Analysis failed: {e}"
 
-    output = f"Color Contrast Analysis:\n"
-    output += f"  Foreground: {foreground}\n"
-    output += f"  Background: {background}\n"
-    output += f"  Text Size: {text_size}\n"
-    output += f"  Contrast Ratio: {result['contrast_ratio']}:1\n"
-    output += f"  WCAG AA: {'✓ Pass' if result['wcag_aa'] else '✗ Fail'}\n"
-    output += f"  WCAG AAA: {'✓ Pass' if result['wcag_aaa'] else '✗ Fail'}\n"
-    output += f"  Recommendation: {result['recommendation']}\n"
+    parts = ["Color Contrast Analysis:\n"]
+    parts.append(f"  Foreground: {foreground}\n")
+    parts.append(f"  Background: {background}\n")
+    parts.append(f"  Text Size: {text_size}\n")
+    parts.append(f"  Contrast Ratio: {result['contrast_ratio']}:1\n")
+    parts.append(f"  WCAG AA: {'✓ Pass' if result['wcag_aa'] else '✗ Fail'}\n")
+    parts.append(f"  WCAG AAA: {'✓ Pass' if result['wcag_aaa'] else '✗ Fail'}\n")
+    parts.append(f"  Recommendation: {result['recommendation']}\n")
 
-    return output
+    return "".join(parts)
+
+
+def check_contrast_ratios(
+    foregrounds: List[str], backgrounds: List[str], text_size: str = "normal"
+) -> str:
+    """
+    Check contrast ratios for many color pairs, e.g. a design system palette.
+
+    Args:
+        foregrounds: Foreground colors (hex format)
+        backgrounds: Background colors, paired with foregrounds by position
+        text_size: "normal" or "large" text
+
+    Returns:
+        Contrast ratio analysis for every pair
+    """
+    try:
+        results = check_color_contrast_batch(foregrounds, backgrounds, text_size)
+    except ValueError as e:
+        return f"Color Contrast Analysis failed: {e}"
+
+    parts = [f"Color Contrast Analysis ({text_size} text):\n\n"]
+    for foreground, background, result in zip(foregrounds, backgrounds, results):
+        status = "AAA" if result["wcag_aaa"] else "AA" if result["wcag_aa"] else "FAIL"
+        parts.append(
+            f"• {foreground} on {background}: "
+            f"{result['contrast_ratio']}:1 [{status}]\n"
+        )
+
+    return "".join(parts)
+
+
+def focus_system_prompt(ctx: RunContext[UIAnalysisContext]) -> str:
+    """
+    Build the system prompt for the run's analysis focus.
+
+    Args:
+        ctx: Agent run context with the analysis focus
+
+    Returns:
+        System prompt text, trimmed for focused analyses
+    """
+    return get_system_prompt(ctx.deps.analysis_focus)
+
+
+# Tools registered on the agent when it is created
+_CONTEXT_TOOLS = (
+    analyze_accessibility,
+    analyze_responsive_patterns,
+    analyze_performance_optimizations,
+    analyze_ux_best_practices,
+)
+_PLAIN_TOOLS = (
+    get_wcag_reference,
+    check_contrast_ratio,
+    check_contrast_ratios,
+)
+
+_agent: Optional[Agent[UIAnalysisContext, str]] = None
+_agent_lock = threading.Lock()
+
+
+def get_agent() -> Agent[UIAnalysisContext, str]:
+    """
+    Get the shared UI Specialist agent, creating it on first use.
+
+    Settings loading and model setup happen once per process, guarded by a
+    lock so concurrent first callers don't build duplicate agents.
+
+    Returns:
+        Agent: Configured agent with all analysis tools registered
+    """
+    global _agent
+    if _agent is None:
+        with _agent_lock:
+            if _agent is None:
+                agent = Agent(get_llm_model(), deps_type=UIAnalysisContext)
+                agent.system_prompt(focus_system_prompt)
+                for context_tool in _CONTEXT_TOOLS:
+                    agent.tool(context_tool)
+                for plain_tool in _PLAIN_TOOLS:
+                    agent.tool_plain(plain_tool)
+                _agent = agent
+    return _agent
+
+
+async def _get_agent_async() -> Agent[UIAnalysisContext, str]:
+    """Get the shared agent without running first-time setup on the event loop."""
+    if _agent is not None:
+        return _agent
+    return await asyncio.to_thread(get_agent)
+
+
+async def _build_context(
+    component_code: str, analysis_focus: str, context_kwargs: Dict[str, Any]
+) -> UIAnalysisContext:
+    """Create the analysis context for a run."""
+    deps = UIAnalysisContext(
+        component_code=component_code,
+        analysis_focus=analysis_focus,
+        **context_kwargs,
+    )
+
+    # Scan large components off the event loop; the tools only read deps.scan
+    if len(component_code) > OFFLOAD_SCAN_CHARS:
+        await asyncio.to_thread(lambda: deps.scan)
+    return deps
+
+
+# Queued by the streaming producer once the run has finished
+_STREAM_END = object()
+
+
+async def _stream_text(
+    agent: Agent[UIAnalysisContext, str], prompt: str, deps: UIAnalysisContext
+) -> AsyncIterator[str]:
+    """Yield the text of every model response in a run, as it is generated."""
+    # Stream text deltas from every model response; run_stream would stop at
+    # the first text part and never return tool results to the model
+    async with agent.iter(prompt, deps=deps) as run:
+        async for node in run:
+            if not Agent.is_model_request_node(node):
+                continue
+            async with node.stream(run.ctx) as response_stream:
+                async for event in response_stream:
+                    if isinstance(event, PartStartEvent) and isinstance(
+                        event.part, TextPart
+                    ):
+                        if event.part.content:
+                            yield event.part.content
+                    elif isinstance(event, PartDeltaEvent) and isinstance(
+                        event.delta, TextPartDelta
+                    ):
+                        yield event.delta.content_delta
+
+
+async def analyze_component_stream(
+    component_code: str,
+    analysis_focus: str = "general",
+    **context_kwargs,
+) -> AsyncIterator[str]:
+    """
+    Analyze a React component, yielding the response text as it is generated.
+
+    The run continues through any tool calls, so text the model writes before
+    calling a tool is streamed as well as the final answer. Use
+    analyze_component for the final answer alone.
+
+    Args:
+        component_code: The React component code to analyze
+        analysis_focus: Focus area (general, accessibility, responsive, performance, ux)
+        **context_kwargs: Additional context parameters
+
+    Yields:
+        Chunks of the analysis text, in order
+
+    Raises:
+        asyncio.TimeoutError: If the run exceeds the configured request_timeout
+    """
+    deps = await _build_context(component_code, analysis_focus, context_kwargs)
+    prompt = get_analysis_prompt(component_code, analysis_focus)
+    agent = await _get_agent_async()
+
+    # The run streams in its own task so the deadline can cancel it whatever
+    # step it is on, without cancelling the caller
+    chunks: "asyncio.Queue[Any]" = asyncio.Queue()
+
+    async def produce() -> None:
+        try:
+            async for chunk in _stream_text(agent, prompt, deps):
+                chunks.put_nowait(chunk)
+        except Exception as error:
+            chunks.put_nowait(error)
+        else:
+            chunks.put_nowait(_STREAM_END)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + load_settings().request_timeout
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            chunk = await asyncio.wait_for(
+                chunks.get(), timeout=max(deadline - loop.time(), 0)
+            )
+            if chunk is _STREAM_END:
+                return
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
 
 
 async def analyze_component(
@@ -179,6 +378,9 @@ async def analyze_component(
     """
     Analyze a React component for UI/UX issues and recommendations.
 
+    Results are kept in the shared response cache, so repeat analyses of the
+    same component, focus and context skip the agent run.
+
     Args:
         component_code: The React component code to analyze
         analysis_focus: Focus area (general, accessibility, responsive, performance, ux)
@@ -186,21 +388,119 @@ async def analyze_component(
 
     Returns:
         Analysis results and recommendations
+
+    Raises:
+        asyncio.TimeoutError: If the run exceeds the configured request_timeout
     """
-    # Create analysis context
-    deps = UIAnalysisContext(
-        component_code=component_code,
-        analysis_focus=analysis_focus,
-        **context_kwargs,
+    # Getting the agent first loads settings off the event loop, so creating
+    # the cache from them doesn't block it
+    agent = await _get_agent_async()
+    cache = get_response_cache()
+    scope = (analysis_focus, repr(sorted(context_kwargs.items())))
+    digest = component_digest(component_code)
+
+    # Only semantic lookups block on embedding work; exact ones stay inline
+    if cache.semantic:
+        cached = await asyncio.to_thread(cache.get, component_code, scope, digest)
+    else:
+        cached = cache.get(component_code, scope, digest)
+    if cached is not None:
+        return cached
+
+    deps = await _build_context(component_code, analysis_focus, context_kwargs)
+    prompt = get_analysis_prompt(component_code, analysis_focus)
+
+    result = await asyncio.wait_for(
+        agent.run(prompt, deps=deps), timeout=load_settings().request_timeout
     )
+    if cache.semantic:
+        await asyncio.to_thread(cache.put, component_code, scope, result.output, digest)
+    else:
+        cache.put(component_code, scope, result.output, digest)
+    return result.output
 
-    # Generate analysis prompt
-    prompt = get_analysis_prompt(component_code, analysis_focus)
 
-    # Run agent with context
-    result = await agent.run(prompt, deps=deps)
+async def analyze_component_structured(
+    component_code: str,
+    analysis_focus: str = "general",
+    **context_kwargs,
+) -> AnalysisResult:
+    """
+    Analyze a React component and return a structured result.
+
+    All analyzers run before the agent does and their findings are embedded in
+    the prompt, so the model can answer in a single turn. The analysis tools
+    stay available in case it wants to check anything else.
+
+    Args:
+        component_code: The React component code to analyze
+        analysis_focus: Focus area (general, accessibility, responsive, performance, ux)
+        **context_kwargs: Additional context parameters
+
+    Returns:
+        AnalysisResult: Summary, recommendations and scores
+
+    Raises:
+        asyncio.TimeoutError: If the run exceeds the configured request_timeout
+    """
+    deps = await _build_context(component_code, analysis_focus, context_kwargs)
+    prompt = get_structured_analysis_prompt(
+        component_code, analysis_focus, deps.scan
+    )
+
+    agent = await _get_agent_async()
+    result = await asyncio.wait_for(
+        agent.run(prompt, deps=deps, output_type=AnalysisResult),
+        timeout=load_settings().request_timeout,
+    )
+    return result.output
+
+
+async def analyze_components_batch(
+    component_codes: List[str],
+    analysis_focus: str = "general",
+    max_concurrency: int = 32,
+    **context_kwargs,
+) -> List[str]:
+    """
+    Analyze several React components concurrently.
+
+    Args:
+        component_codes: The React component code snippets to analyze
+        analysis_focus: Focus area applied to every component
+        max_concurrency: Maximum number of agent runs in flight at once
+        **context_kwargs: Additional context parameters shared by all runs
+
+    Returns:
+        Analysis results in the same order as component_codes
+
+    Raises:
+        ValueError: If max_concurrency is less than 1
+
+    If any analysis fails, the runs still pending are cancelled and the
+    first error is raised.
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def analyze_one(component_code: str) -> str:
+        async with semaphore:
+            return await analyze_component(
+                component_code, analysis_focus, **context_kwargs
+            )
 
-    return result.data
+    tasks = [asyncio.create_task(analyze_one(code)) for code in component_codes]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        # gather leaves the other runs going when one fails; stop them and
+        # wait so none outlives the batch
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
 
 async def main():
@@ -246,6 +546,11 @@ export const LoginForm: FC = () => {
 
 
 if __name__ == "__main__":
-    import asyncio
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:  # Optional: faster event loop (not on Windows)
+        pass
 
     asyncio.run(main())
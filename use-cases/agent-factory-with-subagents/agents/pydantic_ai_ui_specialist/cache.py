@@ -0,0 +1,250 @@
+"""
+UI Specialist Response Cache
+
+Caches analyze_component results so repeat analyses of a component skip the
+LLM call entirely.
+"""
+
+import threading
+import warnings
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from .settings import load_settings
+from .tools import _optional_import, component_digest, scan_all
+
+faiss = _optional_import("faiss")  # Nearest-neighbour search over embeddings
+np = _optional_import("numpy")
+sentence_transformers = _optional_import("sentence_transformers")
+
+# Small local model; embeddings are normalized so inner product is cosine
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# Nearest neighbours checked per lookup before giving up on a semantic match
+_SEARCH_DEPTH = 8
+
+# Recent embeddings kept so put() reuses the one get() computed for a run
+_EMBEDDING_MEMO_SIZE = 64
+
+
+class ResponseCache:
+    """
+    LRU cache of analysis results.
+
+    Exact repeats are matched on the component digest. With semantic matching
+    enabled (and faiss, numpy and sentence-transformers installed), a miss
+    falls back to the most similar cached component whose cosine similarity
+    reaches the threshold. Semantic matches are only taken between components
+    in the same scope with the same static analyzer findings, and only for
+    components short enough for the embedding model to see in full; longer
+    ones are matched exactly. If the model can't be loaded or fails to encode,
+    semantic matching is switched off and lookups become exact-only.
+    """
+
+    def __init__(self, max_entries: int, similarity: float, semantic: bool = False):
+        self.max_entries = max_entries
+        self.similarity = similarity
+        self.semantic = (
+            semantic
+            and similarity <= 1.0
+            and faiss is not None
+            and np is not None
+            and sentence_transformers is not None
+        )
+        self.entries: "OrderedDict[Tuple[Hashable, str], Tuple[int, str]]" = (
+            OrderedDict()
+        )
+        self.keys: Dict[int, Tuple[Tuple[Hashable, str], Hashable]] = {}
+        self.embeddings: "OrderedDict[str, Any]" = OrderedDict()
+        self.next_id = 0
+        self.encoder: Any = None
+        self.index: Any = None
+        self.lock = threading.Lock()
+        # Separate from lock so loading the model never blocks exact lookups
+        self.encoder_lock = threading.Lock()
+
+    def get(
+        self, component_code: str, scope: Hashable, digest: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Look up a cached result.
+
+        Blocks on embedding work when semantic matching is enabled, so call
+        it from a worker thread in async code.
+
+        Args:
+            component_code: The React component code being analyzed
+            scope: Everything else the result depends on, e.g. the focus
+            digest: component_digest of component_code, if already computed
+
+        Returns:
+            Cached analysis text, or None on a miss
+        """
+        if self.max_entries <= 0:
+            return None
+
+        digest = digest or component_digest(component_code)
+        key = (scope, digest)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                return entry[1]
+
+        embedding = self._embed(component_code, digest)
+        if embedding is None:
+            return None
+
+        semantic_scope = _semantic_scope(component_code, scope)
+        with self.lock:
+            if not self.index.ntotal:
+                return None
+            scores, ids = self.index.search(
+                embedding, min(_SEARCH_DEPTH, self.index.ntotal)
+            )
+            for score, entry_id in zip(scores[0], ids[0]):
+                if score < self.similarity:
+                    break
+                match = self.keys.get(int(entry_id))
+                if match is not None and match[1] == semantic_scope:
+                    self.entries.move_to_end(match[0])
+                    return self.entries[match[0]][1]
+        return None
+
+    def put(
+        self,
+        component_code: str,
+        scope: Hashable,
+        result: str,
+        digest: Optional[str] = None,
+    ) -> None:
+        """
+        Store a result, evicting the least recently used entry when full.
+
+        Args:
+            component_code: The React component code that was analyzed
+            scope: Everything else the result depends on, e.g. the focus
+            result: Analysis text to cache
+            digest: component_digest of component_code, if already computed
+        """
+        if self.max_entries <= 0:
+            return
+
+        digest = digest or component_digest(component_code)
+        key = (scope, digest)
+        embedding = self._embed(component_code, digest)
+        semantic_scope = None
+        if embedding is not None:
+            semantic_scope = _semantic_scope(component_code, scope)
+
+        with self.lock:
+            if key in self.entries:
+                entry_id = self.entries[key][0]
+                self.entries[key] = (entry_id, result)
+                self.entries.move_to_end(key)
+                return
+
+            entry_id = self.next_id
+            self.next_id += 1
+            self.entries[key] = (entry_id, result)
+            self.keys[entry_id] = (key, semantic_scope)
+            if embedding is not None:
+                self.index.add_with_ids(embedding, np.array([entry_id], dtype=np.int64))
+
+            if len(self.entries) > self.max_entries:
+                _, (old_id, _) = self.entries.popitem(last=False)
+                del self.keys[old_id]
+                if self.index is not None:
+                    self.index.remove_ids(np.array([old_id], dtype=np.int64))
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self.lock:
+            self.entries.clear()
+            self.keys.clear()
+            self.embeddings.clear()
+            if self.index is not None:
+                self.index.reset()
+
+    def _embed(self, component_code: str, digest: str) -> Any:
+        """Embed the component, or return None if it can't be matched semantically."""
+        if not self.semantic:
+            return None
+
+        with self.lock:
+            embedding = self.embeddings.get(digest)
+        if embedding is not None:
+            return embedding
+
+        try:
+            encoder = self._load_encoder()
+            # The model truncates longer input, so the embedding would only
+            # cover the start of the component; match those exactly instead
+            token_count = len(encoder.tokenizer.tokenize(component_code)) + 2
+            if token_count > encoder.max_seq_length:
+                return None
+            embedding = encoder.encode(
+                [component_code], normalize_embeddings=True
+            ).astype(np.float32)
+        except Exception as error:
+            self.semantic = False
+            warnings.warn(
+                f"Semantic response caching disabled: {error}", RuntimeWarning
+            )
+            return None
+
+        with self.lock:
+            self.embeddings[digest] = embedding
+            if len(self.embeddings) > _EMBEDDING_MEMO_SIZE:
+                self.embeddings.popitem(last=False)
+        return embedding
+
+    def _load_encoder(self) -> Any:
+        """Load the embedding model and create the index on first use."""
+        with self.encoder_lock:
+            if self.encoder is None:
+                encoder = sentence_transformers.SentenceTransformer(EMBEDDING_MODEL)
+                index = faiss.IndexIDMap(
+                    faiss.IndexFlatIP(encoder.get_sentence_embedding_dimension())
+                )
+                with self.lock:
+                    self.index = index
+                self.encoder = encoder
+            return self.encoder
+
+
+def _semantic_scope(
+    component_code: str, scope: Hashable
+) -> Tuple[Hashable, Tuple[str, ...]]:
+    """
+    Key for the components a semantic match may be taken between.
+
+    Components may only share a result when they are in the same scope and
+    the analyzers agree on them.
+
+    Args:
+        component_code: The React component code
+        scope: Everything else the result depends on, e.g. the focus
+
+    Returns:
+        The scope paired with the titles of every analyzer finding
+    """
+    findings = scan_all(component_code)
+    return scope, tuple(issue.issue for issues in findings.values() for issue in issues)
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache:
+    """
+    Get the shared response cache, sized from settings.
+
+    Returns:
+        ResponseCache: Process-wide cache used by analyze_component
+    """
+    settings = load_settings()
+    return ResponseCache(
+        settings.response_cache_size,
+        settings.response_cache_similarity,
+        semantic=settings.response_cache_semantic,
+    )
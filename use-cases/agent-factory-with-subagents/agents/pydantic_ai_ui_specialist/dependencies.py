@@ -5,10 +5,12 @@ Defines the dependency classes and context for the UI/UX specialist agent.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from .tools import Issue, scan_all
 
-@dataclass
+
+@dataclass(slots=True)
 class UIAnalysisContext:
     """
     Context information for UI/UX analysis.
@@ -30,7 +32,7 @@ class UIAnalysisContext:
     styling_approach: Optional[str] = None  # Tailwind, CSS-in-JS, CSS Modules, etc.
 
     # Design system information
-    design_system_tokens: Dict[str, any] = field(default_factory=dict)
+    design_system_tokens: Dict[str, Any] = field(default_factory=dict)
     component_library: Optional[str] = None  # MUI, Ant Design, custom, etc.
 
     # Accessibility requirements
@@ -39,9 +41,7 @@ class UIAnalysisContext:
     keyboard_nav_required: bool = True
 
     # Target devices and breakpoints
-    target_breakpoints: List[int] = field(
-        default_factory=lambda: [320, 768, 1024, 1440]
-    )
+    target_breakpoints: Tuple[int, ...] = (320, 768, 1024, 1440)
     mobile_first: bool = True
 
     # Performance considerations
@@ -52,7 +52,30 @@ class UIAnalysisContext:
     # Additional context
     existing_patterns: List[str] = field(default_factory=list)
     known_issues: List[str] = field(default_factory=list)
-    user_preferences: Dict[str, any] = field(default_factory=dict)
+    user_preferences: Dict[str, Any] = field(default_factory=dict)
+
+    # Analyzer findings keyed by issue type, filled on first access to scan,
+    # and the component_code they were computed from
+    _scan: Optional[Dict[str, List[Issue]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _scan_code: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def scan(self) -> Dict[str, List[Issue]]:
+        """
+        Findings from every analyzer, computed once per component_code.
+
+        Returns:
+            Dict[str, List[Issue]]: Findings keyed by issue type
+            (accessibility, responsive, performance, ux)
+        """
+        if self._scan is None or self._scan_code is not self.component_code:
+            self._scan = scan_all(self.component_code)
+            self._scan_code = self.component_code
+        return self._scan
 
     def get_context_summary(self) -> str:
         """
@@ -78,7 +101,7 @@ class UIAnalysisContext:
         return " | ".join(summary_parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class UIRecommendation:
     """
     Represents a UI/UX recommendation from the agent.
@@ -93,7 +116,7 @@ class UIRecommendation:
     resources: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """
     Complete analysis result from the UI specialist agent.
@@ -4,7 +4,32 @@ UI Specialist Agent System Prompts
 Defines the system prompts and behavioral instructions for the UI/UX specialist agent.
 """
 
-SYSTEM_PROMPT = """You are an elite UI/UX Specialist with deep expertise in modern frontend development, specifically React 18, TypeScript, and contemporary design patterns. Your mission is to craft exceptional user interfaces that are beautiful, accessible, responsive, and delightful to use.
+import json
+from typing import Dict, List
+
+from .tools import Issue
+
+# Essentials sent on every run. Keep this verbatim and first in the prompt so
+# the provider's automatic prefix cache can reuse it across requests.
+_SYSTEM_CORE = """You are an elite UI/UX Specialist for React 18 and TypeScript. Your mission is to make interfaces accessible, responsive, performant, and delightful to use.
+
+## Your Analysis Approach
+
+When analyzing UI/UX code, you:
+1. **Identify accessibility issues** - WCAG 2.1 compliance, keyboard navigation, ARIA attributes
+2. **Review responsive design** - Mobile-first approach, breakpoint handling, fluid layouts
+3. **Assess performance** - Unnecessary re-renders, code splitting, lazy loading
+4. **Evaluate consistency** - Design system adherence, reusable patterns, component composition
+5. **Check UX patterns** - Loading states, error handling, form validation, user feedback
+
+## Decision-Making Framework
+
+Accessibility first, performance matters, progressive enhancement, mobile first, consistency over novelty, and always give feedback for user actions.
+
+Provide specific, actionable recommendations with code examples, and explain the rationale behind them."""
+
+# Broader guidance, only sent for general analyses
+_SYSTEM_EXTENDED = """
 
 ## Your Core Expertise
 
@@ -18,29 +43,8 @@ You are a master of:
 - **Interactive Features**: Animations (Framer Motion, CSS transitions), drag-and-drop (react-dnd, dnd-kit), gestures
 - **Performance**: Code splitting, lazy loading, render optimization, Core Web Vitals
 
-## Your Analysis Approach
-
-When analyzing UI/UX code or designs, you:
-1. **Identify accessibility issues** - Check for WCAG compliance, keyboard navigation, ARIA attributes
-2. **Review responsive design** - Verify mobile-first approach, breakpoint handling, fluid layouts
-3. **Assess performance** - Look for optimization opportunities, unnecessary re-renders, code splitting
-4. **Evaluate consistency** - Ensure design system adherence, reusable patterns, component composition
-5. **Check UX patterns** - Validate loading states, error handling, form validation, user feedback
-
-## Decision-Making Framework
-
-When providing recommendations:
-1. **Accessibility First**: Prioritize accessibility over aesthetics
-2. **Performance Matters**: Suggest lazy loading, code splitting, render optimization
-3. **Progressive Enhancement**: Ensure basic functionality without JavaScript/CSS
-4. **Mobile First**: Design for constraints first, then enhance for larger screens
-5. **Consistency Over Novelty**: Follow established patterns unless compelling reason to deviate
-6. **User Feedback**: Always provide feedback for user actions
-
 ## Communication Style
 
-- Explain design decisions and rationale clearly
-- Provide specific, actionable code examples
 - Highlight accessibility and UX considerations
 - Suggest alternative approaches when appropriate
 - Warn about potential pitfalls or edge cases
@@ -48,14 +52,34 @@ When providing recommendations:
 
 You are the guardian of user experience. Every analysis and recommendation should make interfaces more accessible, performant, and delightful."""
 
+SYSTEM_PROMPT = _SYSTEM_CORE + _SYSTEM_EXTENDED
+
+
+# Focus-specific instructions appended to analysis prompts
+FOCUS_PROMPTS = {
+    "general": "Perform a comprehensive UI/UX analysis covering accessibility, responsive design, performance, and UX patterns.",
+    "accessibility": "Focus on accessibility compliance: WCAG standards, keyboard navigation, ARIA attributes, screen reader support, color contrast.",
+    "responsive": "Focus on responsive design: mobile-first approach, breakpoint strategies, fluid layouts, touch targets.",
+    "performance": "Focus on performance optimization: code splitting, lazy loading, re-render optimization, Core Web Vitals.",
+    "ux": "Focus on UX patterns: loading states, error handling, form validation, user feedback mechanisms.",
+}
 
-def get_system_prompt() -> str:
+
+def get_system_prompt(analysis_focus: str = "general") -> str:
     """
     Get the system prompt for the UI specialist agent.
 
+    Focused analyses only get the core instructions; general (and unknown)
+    focus areas also get the extended guidance.
+
+    Args:
+        analysis_focus: Focus area (general, accessibility, responsive, performance, ux)
+
     Returns:
         str: System prompt text
     """
+    if analysis_focus != "general" and analysis_focus in FOCUS_PROMPTS:
+        return _SYSTEM_CORE
     return SYSTEM_PROMPT
 
 
@@ -70,15 +94,7 @@ def get_analysis_prompt(component_code: str, analysis_focus: str = "general") ->
     Returns:
         str: Formatted analysis prompt
     """
-    focus_prompts = {
-        "general": "Perform a comprehensive UI/UX analysis covering accessibility, responsive design, performance, and UX patterns.",
-        "accessibility": "Focus on accessibility compliance: WCAG standards, keyboard navigation, ARIA attributes, screen reader support, color contrast.",
-        "responsive": "Focus on responsive design: mobile-first approach, breakpoint strategies, fluid layouts, touch targets.",
-        "performance": "Focus on performance optimization: code splitting, lazy loading, re-render optimization, Core Web Vitals.",
-        "ux": "Focus on UX patterns: loading states, error handling, form validation, user feedback mechanisms.",
-    }
-
-    focus_instruction = focus_prompts.get(analysis_focus, focus_prompts["general"])
+    focus_instruction = FOCUS_PROMPTS.get(analysis_focus, FOCUS_PROMPTS["general"])
 
     return f"""Analyze the following React component code:
 
@@ -89,3 +105,54 @@ def get_analysis_prompt(component_code: str, analysis_focus: str = "general") ->
 {focus_instruction}
 
 Provide specific, actionable recommendations with code examples where appropriate."""
+
+
+def get_structured_analysis_prompt(
+    component_code: str,
+    analysis_focus: str,
+    findings: Dict[str, List[Issue]],
+) -> str:
+    """
+    Generate an analysis prompt with the static analyzer findings included.
+
+    The model gets the analyzer results up front, so it can produce the whole
+    structured analysis in one turn instead of calling each analysis tool.
+    Focused analyses only include the findings for their focus area.
+
+    Args:
+        component_code: The React component code to analyze
+        analysis_focus: Focus area (general, accessibility, responsive, performance, ux)
+        findings: Analyzer findings keyed by issue type, see UIAnalysisContext.scan
+
+    Returns:
+        str: Formatted analysis prompt
+    """
+    focus_instruction = FOCUS_PROMPTS.get(analysis_focus, FOCUS_PROMPTS["general"])
+    if analysis_focus in findings:
+        findings = {analysis_focus: findings[analysis_focus]}
+    findings_json = json.dumps(
+        {
+            issue_type: [issue._asdict() for issue in issues]
+            for issue_type, issues in findings.items()
+        },
+        separators=(",", ":"),
+    )
+
+    return f"""Analyze the following React component code:
+
+```typescript
+{component_code}
+```
+
+Static analysis has already run on this component. Its findings are below; \
+you don't need to call the analysis tools again. Confirm, rank and expand on \
+them, and add anything the static checks can't detect:
+
+```json
+{findings_json}
+```
+
+{focus_instruction}
+
+Return the complete analysis as a single structured result, with specific, \
+actionable recommendations and code examples where appropriate."""
@@ -4,6 +4,9 @@ Pydantic AI UI Specialist Agent Configuration
 Handles environment variables and settings for the UI/UX specialist agent.
 """
 
+from functools import lru_cache
+
+import httpx
 from pydantic import Field, ConfigDict
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
@@ -36,12 +39,30 @@ class Settings(BaseSettings):
     max_retries: int = Field(
         default=3, description="Maximum number of retries for failed operations"
     )
+    request_timeout: float = Field(
+        default=120.0, description="Timeout in seconds for a single analysis run"
+    )
+    response_cache_size: int = Field(
+        default=256, description="Analysis results to keep in memory (0 disables)"
+    )
+    response_cache_semantic: bool = Field(
+        default=False,
+        description="Also reuse results for near-identical components "
+        "(needs faiss and sentence-transformers)",
+    )
+    response_cache_similarity: float = Field(
+        default=0.98,
+        description="Minimum cosine similarity for reusing a near-identical result",
+    )
 
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
     """
     Load settings with proper error handling and environment loading.
 
+    The result is cached, so the .env file is read once per process.
+
     Returns:
         Settings: Loaded settings instance
 
@@ -60,15 +81,26 @@ def load_settings() -> Settings:
         raise ValueError(error_msg) from e
 
 
+@lru_cache(maxsize=1)
 def get_llm_model():
     """
     Get configured LLM model with proper environment loading.
 
+    The model is cached along with its HTTP client, so every agent run
+    reuses the same keep-alive connection pool.
+
     Returns:
         OpenAIModel: Configured LLM model instance
     """
     settings = load_settings()
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=64),
+        timeout=httpx.Timeout(settings.request_timeout, connect=10.0),
+    )
     provider = OpenAIProvider(
-        base_url=settings.llm_base_url, api_key=settings.llm_api_key
+        base_url=settings.llm_base_url,
+        api_key=settings.llm_api_key,
+        http_client=http_client,
     )
     return OpenAIModel(settings.llm_model, provider=provider)
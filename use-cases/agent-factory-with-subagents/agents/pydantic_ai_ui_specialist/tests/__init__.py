@@ -0,0 +1 @@
+"""Tests for the UI Specialist agent."""
@@ -0,0 +1,18 @@
+"""Test configuration and fixtures for UI Specialist Agent tests."""
+
+import os
+
+import pytest
+
+# Settings are loaded when the agent is first created; no real calls are made
+os.environ.setdefault("LLM_API_KEY", "test-key")
+
+from ..cache import get_response_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Keep cached analyses from leaking between tests."""
+    get_response_cache().clear()
+    yield
+    get_response_cache().clear()
@@ -0,0 +1,258 @@
+"""Test agent construction and runs driven by tool calls."""
+
+import asyncio
+import re
+import types
+
+import pytest
+from pydantic_ai.messages import ModelResponse, TextPart, ToolCallPart, ToolReturnPart
+from pydantic_ai.models.function import DeltaToolCall, FunctionModel
+
+from .. import agent as agent_module
+from ..settings import load_settings
+from ..agent import (
+    analyze_component,
+    analyze_component_stream,
+    analyze_component_structured,
+    analyze_components_batch,
+    get_agent,
+)
+from ..dependencies import AnalysisResult
+
+COMPONENT = '<img src="logo.png" />'
+
+
+def _tool_was_called(messages) -> bool:
+    return any(
+        isinstance(part, ToolReturnPart)
+        for message in messages
+        for part in getattr(message, "parts", [])
+    )
+
+
+def preamble_then_tool(messages, info):
+    """Answer with a preamble and a tool call, then with the final text."""
+    if _tool_was_called(messages):
+        return ModelResponse(parts=[TextPart("FINAL: based on tool output")])
+    return ModelResponse(
+        parts=[
+            TextPart("Let me check accessibility."),
+            ToolCallPart("analyze_accessibility", {}),
+        ]
+    )
+
+
+async def stream_preamble_then_tool(messages, info):
+    """Streaming counterpart of preamble_then_tool."""
+    if _tool_was_called(messages):
+        yield "FINAL: based "
+        yield "on tool output"
+        return
+    yield "Let me check accessibility."
+    yield {0: DeltaToolCall(name="analyze_accessibility", json_args="{}")}
+
+
+@pytest.fixture
+def tool_calling_model():
+    """Override the shared agent with a model that calls a tool mid-answer."""
+    model = FunctionModel(preamble_then_tool, stream_function=stream_preamble_then_tool)
+    with get_agent().override(model=model):
+        yield
+
+
+class TestAgentModule:
+    """Test how the agent module and shared agent are exposed."""
+
+    def test_submodule_is_a_module(self):
+        """The agent submodule isn't shadowed by the Agent instance."""
+        assert isinstance(agent_module, types.ModuleType)
+        assert agent_module.analyze_component is analyze_component
+
+    def test_get_agent_is_shared(self):
+        """get_agent builds the agent once and reuses it."""
+        assert get_agent() is get_agent()
+
+
+class TestToolDrivenRuns:
+    """Test that tool calls are completed before the answer is returned."""
+
+    @pytest.mark.asyncio
+    async def test_analyze_component_returns_final_answer(self, tool_calling_model):
+        """Text sent alongside a tool call is not mistaken for the answer."""
+        result = await analyze_component(COMPONENT)
+
+        assert result == "FINAL: based on tool output"
+
+    @pytest.mark.asyncio
+    async def test_cached_result_is_final_answer(self, tool_calling_model):
+        """The response cache stores the final answer, not the preamble."""
+        await analyze_component(COMPONENT)
+        result = await analyze_component(COMPONENT)
+
+        assert result == "FINAL: based on tool output"
+
+    @pytest.mark.asyncio
+    async def test_stream_continues_after_tool_call(self, tool_calling_model):
+        """Streaming runs the tool and streams the final answer after it."""
+        chunks = [chunk async for chunk in analyze_component_stream(COMPONENT)]
+
+        assert "".join(chunks).endswith("FINAL: based on tool output")
+
+
+class TestStreamTimeout:
+    """Test that streaming runs are bounded by request_timeout."""
+
+    @pytest.mark.asyncio
+    async def test_stream_times_out(self, monkeypatch):
+        """A model that stalls mid-stream raises TimeoutError once time is up."""
+        monkeypatch.setattr(load_settings(), "request_timeout", 0.05)
+        cancelled = []
+
+        async def stall_after_first_chunk(messages, info):
+            yield "Looking at the component"
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            yield " never sent"
+
+        model = FunctionModel(stream_function=stall_after_first_chunk)
+        chunks = []
+        with get_agent().override(model=model):
+            with pytest.raises(asyncio.TimeoutError):
+                async for chunk in analyze_component_stream(COMPONENT):
+                    chunks.append(chunk)
+
+        assert "".join(chunks) == "Looking at the component"
+        assert cancelled == [True]
+
+
+class TestStructuredAnalysis:
+    """Test the single-turn structured entry point."""
+
+    @pytest.mark.asyncio
+    async def test_answers_from_embedded_findings(self):
+        """The findings are in the first request, so no analysis tool is needed."""
+        requests = []
+
+        def answer_with_result(messages, info):
+            requests.append(list(messages))
+            return ModelResponse(
+                parts=[
+                    ToolCallPart(
+                        info.output_tools[0].name,
+                        {
+                            "summary": "Image needs alt text",
+                            "recommendations": [],
+                            "accessibility_score": 60,
+                        },
+                    )
+                ]
+            )
+
+        with get_agent().override(model=FunctionModel(answer_with_result)):
+            result = await analyze_component_structured(COMPONENT)
+
+        first_prompt = "".join(
+            part.content
+            for part in requests[0][0].parts
+            if isinstance(getattr(part, "content", None), str)
+        )
+        assert '"issue":"Images without alt text"' in first_prompt
+        # One model request: no analysis tool round trip before the answer
+        assert len(requests) == 1
+        assert isinstance(result, AnalysisResult)
+        assert result.summary == "Image needs alt text"
+        assert result.accessibility_score == 60
+
+
+def _component_index(messages) -> int:
+    """Index of the numbered component named in the user prompt."""
+    prompt = "".join(
+        part.content
+        for part in messages[0].parts
+        if isinstance(getattr(part, "content", None), str)
+    )
+    return int(re.search(r"Card(\d+)", prompt).group(1))
+
+
+def numbered_components(count: int) -> list:
+    """Distinct components the batch models can tell apart."""
+    return [f"export const Card{index} = () => <div />" for index in range(count)]
+
+
+class TestBatch:
+    """Test analyzing several components at once."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self):
+        """Results line up with the inputs even when runs finish out of order."""
+
+        async def reply_slowest_first(messages, info):
+            index = _component_index(messages)
+            await asyncio.sleep(0.01 * (5 - index))
+            return ModelResponse(parts=[TextPart(f"result {index}")])
+
+        with get_agent().override(model=FunctionModel(reply_slowest_first)):
+            results = await analyze_components_batch(numbered_components(5))
+
+        assert results == [f"result {index}" for index in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_caps_runs_in_flight(self):
+        """No more than max_concurrency agent runs are in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def count_in_flight(messages, info):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return ModelResponse(parts=[TextPart("done")])
+
+        with get_agent().override(model=FunctionModel(count_in_flight)):
+            await analyze_components_batch(numbered_components(8), max_concurrency=3)
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_pending_runs(self):
+        """When one run fails, the others are cancelled rather than left running."""
+        cancelled = []
+        others_started = asyncio.Event()
+        started = 0
+
+        async def fail_first(messages, info):
+            nonlocal started
+            index = _component_index(messages)
+            if index == 0:
+                # Fail only once the other runs are waiting on the model
+                await others_started.wait()
+                raise RuntimeError("model unavailable")
+            started += 1
+            if started == 3:
+                others_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(index)
+                raise
+            return ModelResponse(parts=[TextPart("done")])
+
+        with get_agent().override(model=FunctionModel(fail_first)):
+            with pytest.raises(RuntimeError, match="model unavailable"):
+                await analyze_components_batch(numbered_components(4))
+
+        assert sorted(cancelled) == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    async def test_invalid_max_concurrency_raises(self, max_concurrency):
+        """max_concurrency below 1 is rejected instead of hanging."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await analyze_components_batch(
+                numbered_components(2), max_concurrency=max_concurrency
+            )
@@ -0,0 +1,179 @@
+"""Test the analyze_component response cache."""
+
+import types
+
+import pytest
+
+from .. import cache as cache_module
+from ..cache import ResponseCache
+from ..tools import component_digest
+
+CARD = "export const Card = () => <div className='card'>Hello from the card</div>"
+
+
+class TestExactCache:
+    """Test digest-keyed caching."""
+
+    def test_hit_after_put(self):
+        """A stored result is returned for the same code and scope."""
+        cache = ResponseCache(4, 0.98)
+        cache.put(CARD, "general", "analysis")
+
+        assert cache.get(CARD, "general") == "analysis"
+
+    def test_precomputed_digest_matches_computed(self):
+        """Passing the component's digest finds the same entry as hashing it."""
+        cache = ResponseCache(4, 0.98)
+        cache.put(CARD, "general", "analysis", component_digest(CARD))
+
+        assert cache.get(CARD, "general") == "analysis"
+        assert cache.get(CARD, "general", component_digest(CARD)) == "analysis"
+
+    def test_scopes_are_separate(self):
+        """The same component under another scope is a miss."""
+        cache = ResponseCache(4, 0.98)
+        cache.put(CARD, "general", "general analysis")
+
+        assert cache.get(CARD, "ux") is None
+        assert cache.get(CARD, "general") == "general analysis"
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted when the cache is full."""
+        cache = ResponseCache(2, 0.98)
+        cache.put("a", "general", "A")
+        cache.put("b", "general", "B")
+        assert cache.get("a", "general") == "A"  # "b" is now least recent
+
+        cache.put("c", "general", "C")
+
+        assert cache.get("b", "general") is None
+        assert cache.get("a", "general") == "A"
+        assert cache.get("c", "general") == "C"
+        assert len(cache.entries) == len(cache.keys) == 2
+
+    def test_put_replaces_existing_result(self):
+        """Storing the same key again keeps one entry with the new result."""
+        cache = ResponseCache(4, 0.98)
+        cache.put(CARD, "general", "old")
+        cache.put(CARD, "general", "new")
+
+        assert cache.get(CARD, "general") == "new"
+        assert len(cache.entries) == 1
+
+    def test_zero_size_disables(self):
+        """A cache sized 0 stores nothing."""
+        cache = ResponseCache(0, 0.98)
+        cache.put(CARD, "general", "analysis")
+
+        assert cache.get(CARD, "general") is None
+
+    def test_clear(self):
+        """clear() drops every entry."""
+        cache = ResponseCache(4, 0.98)
+        cache.put(CARD, "general", "analysis")
+        cache.clear()
+
+        assert cache.get(CARD, "general") is None
+
+
+class FakeEncoder:
+    """Stand-in for SentenceTransformer embedding letter frequencies."""
+
+    max_seq_length = 256
+    tokenizer = types.SimpleNamespace(tokenize=str.split)
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+
+    def get_sentence_embedding_dimension(self):
+        return 26
+
+    def encode(self, texts, normalize_embeddings):
+        np = cache_module.np
+        letters = "abcdefghijklmnopqrstuvwxyz"
+        vectors = np.array(
+            [[text.lower().count(letter) + 1e-3 for letter in letters]
+             for text in texts]
+        )
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+class TestSemanticCache:
+    """Test matching of near-identical components."""
+
+    @pytest.fixture
+    def fake_encoder(self, monkeypatch):
+        """Use the real faiss index with a deterministic fake encoder."""
+        pytest.importorskip("faiss")
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(
+            cache_module,
+            "sentence_transformers",
+            types.SimpleNamespace(SentenceTransformer=FakeEncoder),
+        )
+
+    def test_disabled_by_default(self, fake_encoder):
+        """Without semantic=True only exact repeats hit."""
+        cache = ResponseCache(4, 0.98)
+        cache.put(CARD, "general", "analysis")
+
+        assert cache.semantic is False
+        assert cache.get(CARD + " ", "general") is None
+
+    def test_similarity_above_one_disables(self, fake_encoder):
+        """A threshold no match can reach turns semantic matching off."""
+        assert ResponseCache(4, 1.5, semantic=True).semantic is False
+
+    def test_near_identical_component_hits(self, fake_encoder):
+        """Whitespace-only edits reuse the cached result."""
+        cache = ResponseCache(4, 0.98, semantic=True)
+        cache.put(CARD, "general", "analysis")
+
+        assert cache.get(CARD + "\n", "general") == "analysis"
+        assert cache.get(CARD + "\n", "ux") is None
+
+    def test_different_findings_miss(self, fake_encoder):
+        """A similar component with different analyzer findings is a miss."""
+        cache = ResponseCache(4, 0.98, semantic=True)
+        cache.put(CARD, "general", "analysis")
+
+        assert cache.get(CARD + "<img src='x' />", "general") is None
+
+    def test_long_component_is_exact_only(self, fake_encoder):
+        """Components the model would truncate are never matched semantically."""
+        long_card = " ".join([CARD] * 40)
+        cache = ResponseCache(4, 0.98, semantic=True)
+        cache.put(long_card, "general", "analysis")
+
+        assert cache.get(long_card + " ", "general") is None
+        assert cache.get(long_card, "general") == "analysis"
+
+    def test_evicted_entries_leave_the_index(self, fake_encoder):
+        """Eviction removes the entry's vector as well as its result."""
+        cache = ResponseCache(1, 0.98, semantic=True)
+        cache.put(CARD, "general", "first")
+        cache.put("const other = 1", "general", "second")
+
+        assert cache.index.ntotal == 1
+        assert cache.get(CARD + "\n", "general") is None
+
+    def test_encoder_failure_is_a_miss(self, monkeypatch):
+        """If the model can't load, lookups fall back to exact matching."""
+        monkeypatch.setattr(cache_module, "faiss", object())
+        monkeypatch.setattr(cache_module, "np", object())
+
+        def offline(model_name):
+            raise OSError("no network")
+
+        monkeypatch.setattr(
+            cache_module,
+            "sentence_transformers",
+            types.SimpleNamespace(SentenceTransformer=offline),
+        )
+        cache = ResponseCache(4, 0.98, semantic=True)
+        with pytest.warns(RuntimeWarning):
+            cache.put(CARD, "general", "analysis")
+
+        assert cache.semantic is False
+        assert cache.get(CARD + " ", "general") is None
+        assert cache.get(CARD, "general") == "analysis"
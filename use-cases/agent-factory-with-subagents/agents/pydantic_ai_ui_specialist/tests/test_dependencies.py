@@ -0,0 +1,41 @@
+"""Test the analysis context handed to the agent tools."""
+
+from ..dependencies import UIAnalysisContext
+from ..tools import analyze_accessibility_issues, scan_all
+
+MISSING_ALT = "Images without alt text"
+
+
+def accessibility_titles(issues) -> list:
+    """Titles of the given issues."""
+    return [issue.issue for issue in issues]
+
+
+class TestContextScan:
+    """Test the lazily computed analyzer findings."""
+
+    def test_scan_matches_analyzers(self):
+        """The context exposes the same findings as scan_all."""
+        deps = UIAnalysisContext(component_code='<img src="a.png" />')
+
+        assert deps.scan == scan_all('<img src="a.png" />')
+
+    def test_scan_follows_reassigned_code(self):
+        """Reassigning component_code rescans the new code."""
+        deps = UIAnalysisContext(component_code="<div/>")
+        assert MISSING_ALT not in accessibility_titles(deps.scan["accessibility"])
+
+        deps.component_code = '<img src="a.png" />'
+
+        assert MISSING_ALT in accessibility_titles(deps.scan["accessibility"])
+
+    def test_reassigned_code_does_not_poison_cache(self):
+        """Findings for the new code are never filed under the old code."""
+        scan_all.cache_clear()
+        deps = UIAnalysisContext(component_code="<div/>")
+        deps.component_code = "<img src=x />"
+        deps.scan
+
+        assert MISSING_ALT not in accessibility_titles(
+            analyze_accessibility_issues("<div/>")
+        )
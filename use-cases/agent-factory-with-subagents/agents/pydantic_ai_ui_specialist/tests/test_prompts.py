@@ -0,0 +1,58 @@
+"""Test prompt construction."""
+
+import json
+import re
+
+import pytest
+
+from ..prompts import get_structured_analysis_prompt
+from ..tools import scan_all
+
+COMPONENT = """export const Card = ({ items }) => (
+  <div style={{ width: '320px' }} onClick={() => select(items)}>
+    <img src="card.png" />
+    {items.map(item => <span>{item}</span>)}
+  </div>
+)"""
+
+
+def embedded_findings(prompt: str) -> dict:
+    """The findings JSON embedded in a structured analysis prompt."""
+    return json.loads(re.search(r"```json\n(.*)\n```", prompt).group(1))
+
+
+class TestStructuredAnalysisPrompt:
+    """Test how analyzer findings are embedded in the structured prompt."""
+
+    def test_general_includes_every_category(self):
+        """A general analysis sees the findings of every analyzer."""
+        prompt = get_structured_analysis_prompt(
+            COMPONENT, "general", scan_all(COMPONENT)
+        )
+
+        assert set(embedded_findings(prompt)) == {
+            "accessibility",
+            "responsive",
+            "performance",
+            "ux",
+        }
+
+    @pytest.mark.parametrize(
+        "analysis_focus", ["accessibility", "responsive", "performance", "ux"]
+    )
+    def test_focus_includes_only_its_category(self, analysis_focus):
+        """A focused analysis only sees the findings for its focus area."""
+        findings = scan_all(COMPONENT)
+        prompt = get_structured_analysis_prompt(COMPONENT, analysis_focus, findings)
+
+        assert embedded_findings(prompt) == {
+            analysis_focus: [issue._asdict() for issue in findings[analysis_focus]]
+        }
+
+    def test_unknown_focus_includes_every_category(self):
+        """An unrecognized focus falls back to the general analysis."""
+        prompt = get_structured_analysis_prompt(
+            COMPONENT, "typography", scan_all(COMPONENT)
+        )
+
+        assert len(embedded_findings(prompt)) == 4
@@ -0,0 +1,204 @@
+"""Test the static analyzers behind the agent tools."""
+
+import random
+
+import pytest
+
+from .. import tools
+from ..tools import (
+    analyze_accessibility_issues,
+    check_color_contrast,
+    check_color_contrast_batch,
+)
+
+MISSING_ALT = "Images without alt text"
+MISSING_LABEL = "Form inputs may lack associated labels"
+
+
+def accessibility_issues(component_code: str) -> list:
+    """Titles of the accessibility issues found in component_code."""
+    return [issue.issue for issue in analyze_accessibility_issues(component_code)]
+
+
+def backend_available(name: str) -> bool:
+    """Whether the named scan backend's library is installed."""
+    return {
+        "hyperscan": tools._HYPERSCAN_DB is not None,
+        "re2": tools._RE2_SET is not None,
+        "re": True,
+    }[name]
+
+
+@pytest.fixture(params=["hyperscan", "re2", "re"])
+def scan_backend(request, monkeypatch):
+    """Run the analyzers on one scan backend, skipping it if not installed."""
+    if not backend_available(request.param):
+        pytest.skip(f"{request.param} is not installed")
+    monkeypatch.setattr(tools, "_scan", getattr(tools, f"_scan_{request.param}"))
+    tools.scan_all.cache_clear()
+    yield getattr(tools, f"_scan_{request.param}")
+    tools.scan_all.cache_clear()
+
+
+class TestScanBackends:
+    """Test that every scan backend finds the same pattern names."""
+
+    @pytest.mark.parametrize(
+        "component_code",
+        [
+            "width:\xa010px",
+            "height:\u300012px",
+            "export\xa0const Card = () => null",
+            "export const \u00e9t\u00e9 = () => null",
+            "width: \u0661\u0662px",
+            "<img\u2003src='a.png' alt='a' />",
+            "<button>\u00a0<svg /></button>",
+            "const [isLoad\u0131ng] = useState(false)",
+            "<Spinner /> <SKELETON /> loading",
+        ],
+    )
+    def test_unicode_matches_re(self, scan_backend, component_code):
+        """Non-ASCII whitespace, digits and letters are treated alike."""
+        expected = tools._scan_re(component_code)
+        found = scan_backend(component_code)
+
+        for name in tools._PATTERN_NAMES:
+            assert (name in found) == (name in expected), name
+
+
+@pytest.mark.usefixtures("scan_backend")
+class TestImageAltDetection:
+    """Test detection of images without alt text."""
+
+    @pytest.mark.parametrize(
+        "component_code",
+        [
+            '<img src="logo.png" alt="Company logo" />',
+            '<img\n  src="logo.png"\n  alt=""\n/>',
+            "<img src={user.avatar} onLoad={() => count > 0 && done()} alt={user.name} />",
+            '<img alt="a" src="a.png" /><img src="b.png" alt="b" />',
+        ],
+    )
+    def test_images_with_alt(self, component_code):
+        """Images that all carry alt are not flagged."""
+        assert MISSING_ALT not in accessibility_issues(component_code)
+
+    @pytest.mark.parametrize(
+        "component_code",
+        [
+            '<img src="logo.png" />',
+            "<img/>",
+            '<img src={size > 100 ? large : small} data-alt="logo" />',
+            '<img src="a.png" alt="a" /><img src="b.png" />',
+        ],
+    )
+    def test_images_without_alt(self, component_code):
+        """Any image lacking alt is flagged, even when others have it."""
+        assert MISSING_ALT in accessibility_issues(component_code)
+
+    def test_alt_in_jsx_expression_after_gt(self):
+        """A '>' inside a JSX expression doesn't end the tag early."""
+        component_code = '<img src={a > b ? "x.png" : "y.png"} alt="Chart" />'
+
+        assert MISSING_ALT not in accessibility_issues(component_code)
+
+    def test_similar_tag_names_are_ignored(self):
+        """Only <img> tags are checked, not e.g. <imgCarousel>."""
+        assert MISSING_ALT not in accessibility_issues("<imgCarousel items={items} />")
+
+
+@pytest.mark.usefixtures("scan_backend")
+class TestInputLabelDetection:
+    """Test detection of inputs without an id for a label."""
+
+    @pytest.mark.parametrize(
+        "component_code",
+        [
+            '<input id="email" type="email" />',
+            '<input type="text" onChange={(e) => e.target.value.length > 3} id="name" />',
+        ],
+    )
+    def test_inputs_with_id(self, component_code):
+        """Inputs with an id are not flagged."""
+        assert MISSING_LABEL not in accessibility_issues(component_code)
+
+    @pytest.mark.parametrize(
+        "component_code",
+        [
+            '<input type="email" />',
+            '<input data-testid="email" type="email" />',
+            '<input id="a" /><input name="b" />',
+        ],
+    )
+    def test_inputs_without_id(self, component_code):
+        """data-testid and similar attributes don't count as an id."""
+        assert MISSING_LABEL in accessibility_issues(component_code)
+
+
+class TestColorContrast:
+    """Test WCAG contrast ratio calculations."""
+
+    def test_known_ratio_fails_aa(self):
+        """#777 on white is 4.48:1, just short of AA for normal text."""
+        result = check_color_contrast("#777", "#fff", "normal")
+
+        assert result["contrast_ratio"] == 4.48
+        assert result["wcag_aa"] is False
+        assert result["wcag_aaa"] is False
+
+    def test_large_text_thresholds(self):
+        """Large text passes AA at 3:1, so 4.48:1 passes AA but not AAA."""
+        result = check_color_contrast("#777777", "#FFFFFF", "large")
+
+        assert result["wcag_aa"] is True
+        assert result["wcag_aaa"] is False
+
+    def test_black_on_white_is_maximum(self):
+        """Black on white is the maximum ratio of 21:1."""
+        result = check_color_contrast("#000000", "#ffffff", "normal")
+
+        assert result["contrast_ratio"] == 21.0
+        assert result["wcag_aaa"] is True
+
+    def test_ratio_is_symmetric(self):
+        """Swapping foreground and background gives the same ratio."""
+        assert (
+            check_color_contrast("fff", "777", "normal")["contrast_ratio"]
+            == check_color_contrast("777", "fff", "normal")["contrast_ratio"]
+        )
+
+    @pytest.mark.parametrize("color", ["", "#12", "red", "#gggggg", "#1234567"])
+    def test_invalid_color_raises(self, color):
+        """Colors that aren't 3 or 6 digit hex raise ValueError."""
+        with pytest.raises(ValueError):
+            check_color_contrast(color, "#ffffff", "normal")
+
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    def test_batch_matches_scalar(self, monkeypatch, numpy_available):
+        """The batch check agrees with the scalar one, with or without NumPy."""
+        if not numpy_available:
+            monkeypatch.setattr(tools, "np", None)
+        elif tools.np is None:
+            pytest.skip("NumPy is not installed")
+
+        rng = random.Random(0)
+        foregrounds = [f"#{rng.randrange(0x1000000):06x}" for _ in range(200)]
+        backgrounds = [f"#{rng.randrange(0x1000000):06x}" for _ in range(200)]
+
+        for text_size in ("normal", "large"):
+            assert check_color_contrast_batch(
+                foregrounds, backgrounds, text_size
+            ) == [
+                check_color_contrast(foreground, background, text_size)
+                for foreground, background in zip(foregrounds, backgrounds)
+            ]
+
+    def test_batch_length_mismatch_raises(self):
+        """Foreground and background lists must be the same length."""
+        with pytest.raises(ValueError):
+            check_color_contrast_batch(["#000"], ["#fff", "#000"], "normal")
+
+    def test_batch_invalid_color_raises(self):
+        """An invalid color anywhere in the batch raises ValueError."""
+        with pytest.raises(ValueError):
+            check_color_contrast_batch(["#000", "nope"], ["#fff", "#fff"], "normal")
@@ -5,13 +5,383 @@ Defines the tool functions available to the UI/UX specialist agent.
 These tools help the agent analyze code, check accessibility, and provide recommendations.
 """
 
+import hashlib
+import importlib
 import re
-from typing import List, Dict, Tuple
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Container,
+    List,
+    Dict,
+    Mapping,
+    NamedTuple,
+    FrozenSet,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+
+def _optional_import(name: str) -> Any:
+    """
+    Import an optional dependency.
+
+    Returning Any keeps the module type-checkable (and compilable with mypyc)
+    whether or not the dependency is installed.
+
+    Returns:
+        The imported module, or None if it is not installed
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+hyperscan = _optional_import("hyperscan")  # Faster multi-pattern scanning
+re2 = _optional_import("re2")  # Linear-time regex engine
+np = _optional_import("numpy")  # Vectorized color contrast checks
+
+
+# ASCII whitespace; \x0b rather than \v, which Hyperscan reads as any
+# vertical whitespace
+_SPACE = r'[ \t\n\r\f\x0b]'
+
+
+def _ascii_caseless(word: str) -> str:
+    """Pattern matching word in any ASCII letter case, e.g. [Ll][Oo][Gg]."""
+    return "".join(f"[{char.upper()}{char.lower()}]" for char in word)
+
+
+# Analyzer patterns keyed by the signal name each analyzer checks for.
+# Kept free of lookarounds and \b so Hyperscan can compile them in UCP mode.
+# Character classes and case-insensitive words are spelled out in ASCII
+# rather than written \s, \d, \w or (?i): re and Hyperscan apply those to
+# more of Unicode than RE2 does, and every backend has to find the same names.
+_PATTERNS: Dict[str, str] = {
+    # Accessibility
+    "img_tag": r'<img(?:[ \t\n\r\f\x0b/](?:[^>{]|\{[^}]*\})*)?>',
+    "icon_button": rf'<button[^>]*>{_SPACE}*<(?:svg|i|span{_SPACE}+class=)',
+    "aria_label": r'aria-label=',
+    "input_tag": r'<input(?:[ \t\n\r\f\x0b/](?:[^>{]|\{[^}]*\})*)?>',
+    "click_handler": r'onClick=',
+    "key_handler": r'onKeyDown=|onKeyPress=',
+    # Responsive design
+    "fixed_pixels": rf'width:{_SPACE}*[0-9]+px|height:{_SPACE}*[0-9]+px',
+    "max_width_media": r'@media.*max-width',
+    "viewport": r'viewport',
+    # Performance
+    "exported_component": rf'export{_SPACE}+(?:const|function){_SPACE}+[A-Za-z0-9_]+',
+    "memo": r'React\.memo|memo\(',
+    "inline_handler": r'onClick=\{.*=>',
+    "list_map": r'\.map\(.*=>',
+    "key_prop": r'key=',
+    # UX patterns
+    "state_hook": r'useState|isLoading',
+    "loading_ui": "|".join(
+        _ascii_caseless(word) for word in ("loading", "skeleton", "spinner")
+    ),
+    "error_source": r'catch|error|onError',
+    "error_ui": r'error.*message|ErrorBoundary',
+    "form_field": r'<form|<input',
+    "validation_ui": r'error|valid|invalid',
+}
+
+_PATTERN_NAMES: Tuple[str, ...] = tuple(_PATTERNS)
+
+# RE2 guarantees linear-time matching, so untrusted component code can't
+# trigger catastrophic backtracking; fall back to re when it's missing
+_regex: Any = re2 if re2 is not None else re
+
+# Whole-tag patterns (JSX {...} attribute values may contain '>'), used to
+# inspect each tag's attributes once the scan has seen at least one
+_IMG_TAG: Pattern[str] = _regex.compile(_PATTERNS["img_tag"])
+_INPUT_TAG: Pattern[str] = _regex.compile(_PATTERNS["input_tag"])
+_ALT_ATTR: Pattern[str] = _regex.compile(rf'{_SPACE}alt{_SPACE}*=')
+_ID_ATTR: Pattern[str] = _regex.compile(rf'{_SPACE}id{_SPACE}*=')
+
+
+def _any_tag_missing(
+    tag_pattern: Pattern[str], attribute_pattern: Pattern[str], component_code: str
+) -> bool:
+    """Check whether any tag matched by tag_pattern lacks the given attribute."""
+    return any(
+        not attribute_pattern.search(tag.group(0))
+        for tag in tag_pattern.finditer(component_code)
+    )
+
+
+def _build_hyperscan_db() -> Any:
+    """
+    Compile all analyzer patterns into a single Hyperscan database.
+
+    Returns:
+        hyperscan.Database, or None if Hyperscan is not installed
+    """
+    if hyperscan is None:
+        return None
+
+    flags = (
+        hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    )
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[pattern.encode("utf-8") for pattern in _PATTERNS.values()],
+        ids=list(range(len(_PATTERN_NAMES))),
+        elements=len(_PATTERN_NAMES),
+        flags=[flags] * len(_PATTERN_NAMES),
+    )
+    return db
+
+
+_HYPERSCAN_DB: Any = _build_hyperscan_db()
+# A database shares one scratch space, so scans must not run concurrently
+_HYPERSCAN_LOCK = threading.Lock()
+
+
+def _scan_hyperscan(component_code: str) -> FrozenSet[str]:
+    """Scan with the compiled Hyperscan database."""
+    matched: Set[int] = set()
+
+    def on_match(
+        pattern_id: int, start: int, end: int, flags: int, context: Any
+    ) -> None:
+        matched.add(pattern_id)
+
+    with _HYPERSCAN_LOCK:
+        _HYPERSCAN_DB.scan(
+            component_code.encode("utf-8", errors="replace"),
+            match_event_handler=on_match,
+        )
+    return frozenset(_PATTERN_NAMES[pattern_id] for pattern_id in matched)
+
+
+def _build_re2_set() -> Any:
+    """
+    Compile all analyzer patterns into a single RE2 pattern set.
+
+    Returns:
+        re2.Set, or None if RE2 is not installed
+    """
+    if re2 is None:
+        return None
+
+    pattern_set = re2.Set.SearchSet()
+    for pattern in _PATTERNS.values():
+        pattern_set.Add(pattern)
+    pattern_set.Compile()
+    return pattern_set
+
+
+_RE2_SET: Any = _build_re2_set()
+
+
+def _scan_re2(component_code: str) -> FrozenSet[str]:
+    """Scan with the compiled RE2 pattern set."""
+    # Match returns None rather than an empty list when nothing matches
+    matched = _RE2_SET.Match(component_code) or ()
+    return frozenset(_PATTERN_NAMES[pattern_id] for pattern_id in matched)
+
+
+# Precompiled for the re fallback. Separate searches beat one fused pattern
+# here: each stops at its first match, and only the ones an analyzer asks
+# about run at all.
+_COMPILED: Dict[str, Pattern[str]] = {
+    name: re.compile(pattern) for name, pattern in _PATTERNS.items()
+}
+
+
+class _LazyScan:
+    """Pattern names found in a component, each searched on first lookup."""
+
+    def __init__(self, component_code: str) -> None:
+        self.component_code = component_code
+        self.results: Dict[str, bool] = {}
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+        found = self.results.get(name)
+        if found is None:
+            found = _COMPILED[name].search(self.component_code) is not None
+            self.results[name] = found
+        return found
+
+
+def _scan_re(component_code: str) -> Container[str]:
+    """Scan with Python's re, searching for each pattern only when asked."""
+    return _LazyScan(component_code)
+
+
+def _scan(component_code: str) -> Container[str]:
+    """
+    Scan component code for the names of all matching patterns.
+
+    Uses Hyperscan or RE2 when installed, in that order, which match every
+    pattern in one pass. The re fallback searches lazily instead.
+
+    Args:
+        component_code: React component code to scan
+
+    Returns:
+        Names from _PATTERNS that occur anywhere in the code
+    """
+    if _HYPERSCAN_DB is not None:
+        return _scan_hyperscan(component_code)
+    if _RE2_SET is not None:
+        return _scan_re2(component_code)
+    return _scan_re(component_code)
+
+
+class Issue(NamedTuple):
+    """A single analyzer finding."""
+
+    type: str
+    severity: str
+    issue: str
+    description: str
+    fix: str
+
+
+# Maximum number of distinct components whose findings are remembered
+ANALYSIS_CACHE_SIZE: int = 512
+
+
+def component_digest(component_code: str) -> str:
+    """
+    Compute the cache key for a piece of component code.
+
+    Args:
+        component_code: React component code
+
+    Returns:
+        Hex blake2b digest of the code
+    """
+    return hashlib.blake2b(
+        component_code.encode("utf-8", errors="surrogatepass"), digest_size=16
+    ).hexdigest()
+
+
+class _DigestCache:
+    """
+    Cache analyzer findings keyed on the digest of the component code.
+
+    The digest is always computed from the code being analyzed, never taken
+    from the caller, so a stale key can't file findings under the wrong code.
+    Findings are stored as tuples of Issue and handed out as fresh lists, so
+    callers can't mutate cached entries. Only the digest is kept, not the
+    component code itself.
+    """
+
+    def __init__(self, analyzer: Callable[[str], Dict[str, List[Issue]]]) -> None:
+        self.analyzer = analyzer
+        self.cache: "OrderedDict[str, Dict[str, Tuple[Issue, ...]]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __call__(self, component_code: str) -> Dict[str, List[Issue]]:
+        key = component_digest(component_code)
+        with self.lock:
+            findings = self.cache.get(key)
+            if findings is not None:
+                self.cache.move_to_end(key)
+
+        if findings is None:
+            findings = {
+                issue_type: tuple(issues)
+                for issue_type, issues in self.analyzer(component_code).items()
+            }
+            with self.lock:
+                self.cache[key] = findings
+                if len(self.cache) > ANALYSIS_CACHE_SIZE:
+                    self.cache.popitem(last=False)
+
+        return {issue_type: list(issues) for issue_type, issues in findings.items()}
+
+    def cache_clear(self) -> None:
+        """Drop all cached results."""
+        with self.lock:
+            self.cache.clear()
+
+
+# Minimum contrast ratios (AA, AAA) per WCAG 2.1 success criteria 1.4.3/1.4.6
+_CONTRAST_THRESHOLDS: Dict[str, Tuple[float, float]] = {
+    "normal": (4.5, 7.0),
+    "large": (3.0, 4.5),
+}
+
+# sRGB channel weights for relative luminance
+_LUMINANCE_WEIGHTS: Tuple[float, float, float] = (0.2126, 0.7152, 0.0722)
+
+
+def _normalize_hex_color(color: str) -> str:
+    """
+    Normalize a hex color to six lowercase hex digits without '#'.
+
+    Raises:
+        ValueError: If the color is not in #rgb or #rrggbb format
+    """
+    digits = color.strip().lstrip("#")
+    if len(digits) == 3:
+        digits = "".join(digit * 2 for digit in digits)
+    if len(digits) != 6 or any(c not in "0123456789abcdefABCDEF" for c in digits):
+        raise ValueError(f"Invalid hex color: {color!r}")
+    return digits.lower()
+
+
+def _linearize_channel(channel: float) -> float:
+    """Convert an sRGB channel in [0, 1] to linear light."""
+    if channel <= 0.03928:
+        return channel / 12.92
+    return float(((channel + 0.055) / 1.055) ** 2.4)
+
+
+def _relative_luminance(color: str) -> float:
+    """Compute WCAG relative luminance of a hex color."""
+    rgb = bytes.fromhex(_normalize_hex_color(color))
+    return sum(
+        weight * _linearize_channel(channel / 255)
+        for weight, channel in zip(_LUMINANCE_WEIGHTS, rgb)
+    )
+
+
+def _contrast_result(ratio: float, text_size: str) -> Dict[str, Any]:
+    """Build the compliance report for a contrast ratio."""
+    aa_minimum, aaa_minimum = _CONTRAST_THRESHOLDS.get(
+        text_size, _CONTRAST_THRESHOLDS["normal"]
+    )
+    wcag_aa = ratio >= aa_minimum
+    wcag_aaa = ratio >= aaa_minimum
+
+    if wcag_aaa:
+        recommendation = f"Meets WCAG AAA for {text_size} text"
+    elif wcag_aa:
+        recommendation = (
+            f"Meets WCAG AA for {text_size} text; "
+            f"increase to {aaa_minimum}:1 for AAA"
+        )
+    else:
+        recommendation = (
+            f"Fails WCAG AA for {text_size} text; "
+            f"increase contrast to at least {aa_minimum}:1"
+        )
+
+    return {
+        "contrast_ratio": round(ratio, 2),
+        "wcag_aa": wcag_aa,
+        "wcag_aaa": wcag_aaa,
+        "recommendation": recommendation,
+    }
 
 
 def check_color_contrast(
     foreground: str, background: str, text_size: str = "normal"
-) -> Dict[str, any]:
+) -> Dict[str, Any]:
     """
     Check color contrast ratio for WCAG compliance.
 
@@ -22,223 +392,340 @@ def check_color_contrast(
 
     Returns:
         Dict with contrast ratio and WCAG compliance status
-    """
-    # Simple implementation - would use actual color contrast calculation
-    # For demo purposes, returning mock data
-    return {
-        "contrast_ratio": 4.5,
-        "wcag_aa": True,
-        "wcag_aaa": False,
-        "recommendation": "Meets WCAG AA for normal text",
-    }
-
 
-def analyze_accessibility_issues(component_code: str) -> List[Dict[str, str]]:
+    Raises:
+        ValueError: If either color is not a valid hex color
     """
-    Analyze component code for common accessibility issues.
+    lighter, darker = sorted(
+        (_relative_luminance(foreground), _relative_luminance(background)),
+        reverse=True,
+    )
+    return _contrast_result((lighter + 0.05) / (darker + 0.05), text_size)
+
+
+def _luminance_array(colors: Sequence[str]) -> Any:
+    """Compute WCAG relative luminance of many hex colors as a NumPy array."""
+    hex_digits = "".join(_normalize_hex_color(color) for color in colors)
+    channels = np.frombuffer(bytes.fromhex(hex_digits), dtype=np.uint8)
+    rgb = channels.reshape(-1, 3) / 255.0
+    linear = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    return linear @ np.array(_LUMINANCE_WEIGHTS)
+
+
+def check_color_contrast_batch(
+    foregrounds: Sequence[str],
+    backgrounds: Sequence[str],
+    text_size: str = "normal",
+) -> List[Dict[str, Any]]:
+    """
+    Check many foreground/background pairs for WCAG compliance at once.
+
+    Luminance and ratios are computed vectorized with NumPy when it is
+    installed, which suits design-system audits over whole palettes.
 
     Args:
-        component_code: React component code to analyze
+        foregrounds: Foreground colors (hex format)
+        backgrounds: Background colors, paired with foregrounds by position
+        text_size: "normal" or "large" text
 
     Returns:
-        List of accessibility issues found
+        One compliance dict per pair, as returned by check_color_contrast
+
+    Raises:
+        ValueError: If the sequences differ in length or a color is invalid
     """
+    if len(foregrounds) != len(backgrounds):
+        raise ValueError(
+            f"Got {len(foregrounds)} foregrounds but {len(backgrounds)} backgrounds"
+        )
+
+    if np is None:
+        return [
+            check_color_contrast(foreground, background, text_size)
+            for foreground, background in zip(foregrounds, backgrounds)
+        ]
+
+    foreground_luminance = _luminance_array(foregrounds)
+    background_luminance = _luminance_array(backgrounds)
+    ratios = (np.maximum(foreground_luminance, background_luminance) + 0.05) / (
+        np.minimum(foreground_luminance, background_luminance) + 0.05
+    )
+    return [_contrast_result(float(ratio), text_size) for ratio in ratios]
+
+
+# Findings are immutable, so analyzers hand out shared instances
+_IMG_ALT_ISSUE = Issue(
+    "accessibility",
+    "high",
+    "Images without alt text",
+    "All images should have descriptive alt text for screen readers",
+    'Add alt attribute: <img src="..." alt="Description" />',
+)
+
+_ICON_BUTTON_LABEL_ISSUE = Issue(
+    "accessibility",
+    "high",
+    "Icon buttons without aria-label",
+    "Icon-only buttons need aria-label for screen readers",
+    '<button aria-label="Descriptive label">...</button>',
+)
+
+_INPUT_LABEL_ISSUE = Issue(
+    "accessibility",
+    "medium",
+    "Form inputs may lack associated labels",
+    "Inputs should have associated labels for accessibility",
+    '<label htmlFor="inputId">Label</label><input id="inputId" />',
+)
+
+_KEYBOARD_HANDLER_ISSUE = Issue(
+    "accessibility",
+    "medium",
+    "Click handlers without keyboard support",
+    "Interactive elements with onClick should also handle keyboard events",
+    "Add onKeyDown handler for Enter/Space keys",
+)
+
+_FIXED_PIXELS_ISSUE = Issue(
+    "responsive",
+    "medium",
+    "Hardcoded pixel values detected",
+    "Consider using relative units (rem, em, %) for better responsiveness",
+    "Replace fixed pixels with relative units or CSS variables",
+)
+
+_MAX_WIDTH_MEDIA_ISSUE = Issue(
+    "responsive",
+    "low",
+    "max-width media queries detected",
+    "Consider mobile-first approach with min-width media queries",
+    "Use min-width for progressive enhancement",
+)
+
+_VIEWPORT_ISSUE = Issue(
+    "responsive",
+    "info",
+    "Ensure viewport meta tag is set",
+    "Make sure your HTML includes viewport meta tag for mobile responsiveness",
+    '<meta name="viewport" content="width=device-width, initial-scale=1" />',
+)
+
+_MEMO_ISSUE = Issue(
+    "performance",
+    "low",
+    "Component not memoized",
+    "Consider using React.memo() for components that render frequently with same props",
+    "export const Component = React.memo(({ props }) => { ... })",
+)
+
+_INLINE_HANDLER_ISSUE = Issue(
+    "performance",
+    "medium",
+    "Inline function definitions in JSX",
+    "Inline functions create new instances on each render",
+    "Use useCallback for event handlers: const handleClick = useCallback(() => { ... }, [])",
+)
+
+_KEY_PROP_ISSUE = Issue(
+    "performance",
+    "high",
+    "Missing key prop in list rendering",
+    "Lists need unique key props for efficient re-rendering",
+    "Add unique key: items.map(item => <div key={item.id}>...</div>)",
+)
+
+_LOADING_UI_ISSUE = Issue(
+    "ux",
+    "medium",
+    "Missing loading state UI",
+    "Show loading indicators for async operations",
+    "{isLoading ? <Spinner /> : <Content />}",
+)
+
+_ERROR_UI_ISSUE = Issue(
+    "ux",
+    "high",
+    "Missing error state UI",
+    "Display user-friendly error messages",
+    "{error && <Alert type='error'>{error.message}</Alert>}",
+)
+
+_VALIDATION_UI_ISSUE = Issue(
+    "ux",
+    "medium",
+    "Missing form validation feedback",
+    "Provide real-time validation feedback to users",
+    "Add error states and validation messages to form fields",
+)
+
+
+def _accessibility_issues(component_code: str, found: Container[str]) -> List[Issue]:
+    """Accessibility issues in a component, given its scan results."""
     issues = []
 
     # Check for missing alt text on images
-    if re.search(r'<img[^>]*(?!alt=)', component_code):
-        issues.append({
-            "type": "accessibility",
-            "severity": "high",
-            "issue": "Images without alt text",
-            "description": "All images should have descriptive alt text for screen readers",
-            "fix": 'Add alt attribute: <img src="..." alt="Description" />',
-        })
+    if "img_tag" in found and _any_tag_missing(_IMG_TAG, _ALT_ATTR, component_code):
+        issues.append(_IMG_ALT_ISSUE)
 
     # Check for buttons without aria-label when only icons
-    if re.search(r'<button[^>]*>(?=\s*<(?:svg|i|span\s+class=)', component_code):
-        if not re.search(r'aria-label=', component_code):
-            issues.append({
-                "type": "accessibility",
-                "severity": "high",
-                "issue": "Icon buttons without aria-label",
-                "description": "Icon-only buttons need aria-label for screen readers",
-                "fix": '<button aria-label="Descriptive label">...</button>',
-            })
+    if "icon_button" in found:
+        if "aria_label" not in found:
+            issues.append(_ICON_BUTTON_LABEL_ISSUE)
 
     # Check for forms without labels
-    if re.search(r'<input[^>]*(?!id=)', component_code):
-        issues.append({
-            "type": "accessibility",
-            "severity": "medium",
-            "issue": "Form inputs may lack associated labels",
-            "description": "Inputs should have associated labels for accessibility",
-            "fix": '<label htmlFor="inputId">Label</label><input id="inputId" />',
-        })
+    if "input_tag" in found and _any_tag_missing(
+        _INPUT_TAG, _ID_ATTR, component_code
+    ):
+        issues.append(_INPUT_LABEL_ISSUE)
 
     # Check for missing keyboard event handlers
-    if re.search(r'onClick=', component_code) and not re.search(
-        r'onKeyDown=|onKeyPress=', component_code
-    ):
-        issues.append({
-            "type": "accessibility",
-            "severity": "medium",
-            "issue": "Click handlers without keyboard support",
-            "description": "Interactive elements with onClick should also handle keyboard events",
-            "fix": "Add onKeyDown handler for Enter/Space keys",
-        })
+    if "click_handler" in found and "key_handler" not in found:
+        issues.append(_KEYBOARD_HANDLER_ISSUE)
 
     return issues
 
 
-def analyze_responsive_design(component_code: str) -> List[Dict[str, str]]:
-    """
-    Analyze component for responsive design patterns.
-
-    Args:
-        component_code: React component code to analyze
-
-    Returns:
-        List of responsive design recommendations
-    """
+def _responsive_issues(found: Container[str]) -> List[Issue]:
+    """Responsive design recommendations, given a component's scan results."""
     recommendations = []
 
     # Check for hardcoded pixel values
-    if re.search(r'width:\s*\d+px|height:\s*\d+px', component_code):
-        recommendations.append({
-            "type": "responsive",
-            "severity": "medium",
-            "issue": "Hardcoded pixel values detected",
-            "description": "Consider using relative units (rem, em, %) for better responsiveness",
-            "fix": "Replace fixed pixels with relative units or CSS variables",
-        })
+    if "fixed_pixels" in found:
+        recommendations.append(_FIXED_PIXELS_ISSUE)
 
     # Check for mobile-first media queries
-    if re.search(r'@media.*max-width', component_code):
-        recommendations.append({
-            "type": "responsive",
-            "severity": "low",
-            "issue": "max-width media queries detected",
-            "description": "Consider mobile-first approach with min-width media queries",
-            "fix": "Use min-width for progressive enhancement",
-        })
+    if "max_width_media" in found:
+        recommendations.append(_MAX_WIDTH_MEDIA_ISSUE)
 
     # Check for viewport meta tag consideration
-    if not re.search(r'viewport', component_code):
-        recommendations.append({
-            "type": "responsive",
-            "severity": "info",
-            "issue": "Ensure viewport meta tag is set",
-            "description": "Make sure your HTML includes viewport meta tag for mobile responsiveness",
-            "fix": '<meta name="viewport" content="width=device-width, initial-scale=1" />',
-        })
+    if "viewport" not in found:
+        recommendations.append(_VIEWPORT_ISSUE)
 
     return recommendations
 
 
-def analyze_performance(component_code: str) -> List[Dict[str, str]]:
+def _performance_issues(found: Container[str]) -> List[Issue]:
+    """Performance recommendations, given a component's scan results."""
+    recommendations = []
+
+    # Check for missing React.memo
+    if "exported_component" in found:
+        if "memo" not in found:
+            recommendations.append(_MEMO_ISSUE)
+
+    # Check for inline function definitions in JSX
+    if "inline_handler" in found:
+        recommendations.append(_INLINE_HANDLER_ISSUE)
+
+    # Check for missing key props in lists
+    if "list_map" in found:
+        if "key_prop" not in found:
+            recommendations.append(_KEY_PROP_ISSUE)
+
+    return recommendations
+
+
+def _ux_issues(found: Container[str]) -> List[Issue]:
+    """UX recommendations, given a component's scan results."""
+    recommendations = []
+
+    # Check for loading state handling
+    if "state_hook" in found:
+        if "loading_ui" not in found:
+            recommendations.append(_LOADING_UI_ISSUE)
+
+    # Check for error state handling
+    if "error_source" in found:
+        if "error_ui" not in found:
+            recommendations.append(_ERROR_UI_ISSUE)
+
+    # Check for form validation feedback
+    if "form_field" in found:
+        if "validation_ui" not in found:
+            recommendations.append(_VALIDATION_UI_ISSUE)
+
+    return recommendations
+
+
+@_DigestCache
+def scan_all(component_code: str) -> Dict[str, List[Issue]]:
     """
-    Analyze component for performance optimization opportunities.
+    Run every analyzer over a component.
+
+    Results are cached by the digest of the code.
 
     Args:
         component_code: React component code to analyze
 
     Returns:
-        List of performance recommendations
+        Findings keyed by issue type (accessibility, responsive, performance, ux)
     """
-    recommendations = []
+    found = _scan(component_code)
+    return {
+        "accessibility": _accessibility_issues(component_code, found),
+        "responsive": _responsive_issues(found),
+        "performance": _performance_issues(found),
+        "ux": _ux_issues(found),
+    }
 
-    # Check for missing React.memo
-    if re.search(r'export\s+(?:const|function)\s+\w+', component_code):
-        if not re.search(r'React\.memo|memo\(', component_code):
-            recommendations.append({
-                "type": "performance",
-                "severity": "low",
-                "issue": "Component not memoized",
-                "description": "Consider using React.memo() for components that render frequently with same props",
-                "fix": "export const Component = React.memo(({ props }) => { ... })",
-            })
 
-    # Check for inline function definitions in JSX
-    if re.search(r'onClick=\{.*=>', component_code):
-        recommendations.append({
-            "type": "performance",
-            "severity": "medium",
-            "issue": "Inline function definitions in JSX",
-            "description": "Inline functions create new instances on each render",
-            "fix": "Use useCallback for event handlers: const handleClick = useCallback(() => { ... }, [])",
-        })
+def analyze_accessibility_issues(component_code: str) -> List[Issue]:
+    """
+    Analyze component code for common accessibility issues.
 
-    # Check for missing key props in lists
-    if re.search(r'\.map\(.*=>', component_code):
-        if not re.search(r'key=', component_code):
-            recommendations.append({
-                "type": "performance",
-                "severity": "high",
-                "issue": "Missing key prop in list rendering",
-                "description": "Lists need unique key props for efficient re-rendering",
-                "fix": "Add unique key: items.map(item => <div key={item.id}>...</div>)",
-            })
+    Args:
+        component_code: React component code to analyze
 
-    return recommendations
+    Returns:
+        List of accessibility issues found
+    """
+    return scan_all(component_code)["accessibility"]
 
 
-def analyze_ux_patterns(component_code: str) -> List[Dict[str, str]]:
+def analyze_responsive_design(component_code: str) -> List[Issue]:
     """
-    Analyze component for UX best practices.
+    Analyze component for responsive design patterns.
 
     Args:
         component_code: React component code to analyze
 
     Returns:
-        List of UX recommendations
+        List of responsive design recommendations
     """
-    recommendations = []
+    return scan_all(component_code)["responsive"]
 
-    # Check for loading state handling
-    if re.search(r'useState|isLoading', component_code):
-        if not re.search(r'loading|skeleton|spinner', component_code, re.IGNORECASE):
-            recommendations.append({
-                "type": "ux",
-                "severity": "medium",
-                "issue": "Missing loading state UI",
-                "description": "Show loading indicators for async operations",
-                "fix": "{isLoading ? <Spinner /> : <Content />}",
-            })
 
-    # Check for error state handling
-    if re.search(r'catch|error|onError', component_code):
-        if not re.search(r'error.*message|ErrorBoundary', component_code):
-            recommendations.append({
-                "type": "ux",
-                "severity": "high",
-                "issue": "Missing error state UI",
-                "description": "Display user-friendly error messages",
-                "fix": "{error && <Alert type='error'>{error.message}</Alert>}",
-            })
+def analyze_performance(component_code: str) -> List[Issue]:
+    """
+    Analyze component for performance optimization opportunities.
 
-    # Check for form validation feedback
-    if re.search(r'<form|<input', component_code):
-        if not re.search(r'error|valid|invalid', component_code):
-            recommendations.append({
-                "type": "ux",
-                "severity": "medium",
-                "issue": "Missing form validation feedback",
-                "description": "Provide real-time validation feedback to users",
-                "fix": "Add error states and validation messages to form fields",
-            })
+    Args:
+        component_code: React component code to analyze
 
-    return recommendations
+    Returns:
+        List of performance recommendations
+    """
+    return scan_all(component_code)["performance"]
 
 
-def get_wcag_guidelines() -> List[Dict[str, str]]:
+def analyze_ux_patterns(component_code: str) -> List[Issue]:
     """
-    Get WCAG 2.1 accessibility guidelines summary.
+    Analyze component for UX best practices.
+
+    Args:
+        component_code: React component code to analyze
 
     Returns:
-        List of key WCAG guidelines
+        List of UX recommendations
     """
-    return [
+    return scan_all(component_code)["ux"]
+
+
+# WCAG 2.1 summary returned by get_wcag_guidelines, built once at import.
+# Every caller shares these entries, so they are read-only views.
+_WCAG_GUIDELINES: Tuple[Mapping[str, str], ...] = tuple(
+    MappingProxyType(guideline)
+    for guideline in (
         {
             "principle": "Perceivable",
             "guideline": "Text Alternatives",
@@ -275,4 +762,15 @@ def get_wcag_guidelines() -> List[Dict[str, str]]:
             "requirement": "Elements have appropriate ARIA attributes",
             "level": "A",
         },
-    ]
+    )
+)
+
+
+def get_wcag_guidelines() -> Tuple[Mapping[str, str], ...]:
+    """
+    Get WCAG 2.1 accessibility guidelines summary.
+
+    Returns:
+        Tuple of key WCAG guidelines, as read-only mappings
+    """
+    return _WCAG_GUIDELINES